@@ -10,8 +10,13 @@ def create_app():
     app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
-    app.config['UPLOAD_FOLDER'] = 'uploads'
-    app.config['GENERATED_FOLDER'] = 'generated'
+    app.config['UPLOAD_FOLDER'] = os.environ.get("UPLOAD_FOLDER", 'uploads')
+    app.config['GENERATED_FOLDER'] = os.environ.get("GENERATED_FOLDER", 'generated')
+    # Opt-in request profiling: admin token and/or 1-in-N sampling (0 = off)
+    app.config['PROFILE_FOLDER'] = os.environ.get("PROFILE_FOLDER", 'profiles')
+    app.config['PROFILE_TOKEN'] = os.environ.get("PROFILE_TOKEN")
+    app.config['PROFILE_SAMPLE_RATE'] = int(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+    app.config['PROFILE_MAX_CAPTURES'] = int(os.environ.get("PROFILE_MAX_CAPTURES", 20))
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     os.makedirs(app.config['GENERATED_FOLDER'], exist_ok=True)
 
@@ -0,0 +1,153 @@
+"""Check parser output and speed against the golden resume corpus
+
+Each document in benchmarks/golden/corpus/ has an expected parse in
+benchmarks/golden/expected/ and a baseline parse time in
+benchmarks/golden/timings.json. The check re-parses every document,
+compares every Resume field and the best-of-N parse time, and prints one
+line per document: fields changed and speedup or slowdown. It exits with
+status 1 when any field differs, or when --max-slowdown is given and a
+document parses more than that many times slower than its baseline.
+
+    python -m benchmarks.golden_check             # compare
+    python -m benchmarks.golden_check --verbose   # show expected vs actual
+    python -m benchmarks.golden_check --max-slowdown 1.5
+    python -m benchmarks.golden_check --update    # accept current output and timings
+    python -m benchmarks.golden_check --update-timings
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+from resume_parser import ResumeParser
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+CORPUS_DIR = os.path.join(GOLDEN_DIR, 'corpus')
+EXPECTED_DIR = os.path.join(GOLDEN_DIR, 'expected')
+TIMINGS_PATH = os.path.join(GOLDEN_DIR, 'timings.json')
+
+
+def load_corpus() -> Dict[str, str]:
+    corpus = {}
+    for filename in sorted(os.listdir(CORPUS_DIR)):
+        if filename.endswith('.txt'):
+            with open(os.path.join(CORPUS_DIR, filename), 'r', encoding='utf-8') as f:
+                corpus[filename[:-4]] = f.read()
+    return corpus
+
+
+def parse(parser: ResumeParser, text: str) -> Dict:
+    """Parse every field (forcing lazy extractors) into JSON-compatible data"""
+    data = parser._parse_text(text).to_dict()
+    del data['raw_text']
+    return data
+
+
+def time_parse(parser: ResumeParser, text: str, repeat: int) -> float:
+    """Best-of-``repeat`` wall time of a full parse, in milliseconds"""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(parser, text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _short(value, width: int = 100) -> str:
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def check(repeat: int, verbose: bool, max_slowdown: Optional[float] = None) -> int:
+    parser = ResumeParser()
+    corpus = load_corpus()
+    with open(TIMINGS_PATH, 'r', encoding='utf-8') as f:
+        baseline_times = json.load(f)
+
+    total_fields = matched_fields = 0
+    ratios: List[float] = []
+    changed_docs = slow_docs = 0
+    print(f"{'document':28} {'fields':>7}  {'baseline':>9} {'current':>9} {'speed':>7}  changed")
+    for doc, text in corpus.items():
+        expected_path = os.path.join(EXPECTED_DIR, f"{doc}.json")
+        if not os.path.exists(expected_path):
+            print(f"{doc:28} no expected output, run with --update")
+            changed_docs += 1
+            continue
+        with open(expected_path, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+
+        actual = parse(parser, text)
+        changed = [name for name in expected if actual.get(name) != expected[name]]
+        extra = [name for name in actual if name not in expected]
+        matched = len(expected) - len(changed)
+        total_fields += len(expected)
+        matched_fields += matched
+        changed_docs += bool(changed or extra)
+
+        current = time_parse(parser, text, repeat)
+        baseline = baseline_times.get(doc)
+        if baseline:
+            ratio = baseline / current
+            ratios.append(ratio)
+            speed = f"{ratio:.2f}x"
+            if max_slowdown and current / baseline > max_slowdown:
+                slow_docs += 1
+                speed += '!'
+        else:
+            baseline, speed = math.nan, 'n/a'
+        differences = changed + [f"+{name}" for name in extra]
+        print(f"{doc:28} {matched:>3}/{len(expected):<3}  "
+              f"{baseline:8.3f}ms {current:8.3f}ms {speed:>7}  {', '.join(differences) or '-'}")
+        if verbose:
+            for name in changed:
+                print(f"    {name}:\n      expected {_short(expected.get(name))}\n      actual   {_short(actual.get(name))}")
+
+    accuracy = matched_fields / total_fields if total_fields else 1.0
+    mean_ratio = math.exp(sum(math.log(r) for r in ratios) / len(ratios)) if ratios else math.nan
+    print(f"\nfield accuracy {matched_fields}/{total_fields} ({accuracy:.1%}), "
+          f"{changed_docs} document(s) changed, geometric mean speed {mean_ratio:.2f}x "
+          f"(>1 is faster than baseline)")
+    if slow_docs:
+        print(f"{slow_docs} document(s) more than {max_slowdown:g}x slower than baseline (marked !)")
+    return 1 if changed_docs or slow_docs else 0
+
+
+def update(repeat: int, outputs: bool):
+    parser = ResumeParser()
+    os.makedirs(EXPECTED_DIR, exist_ok=True)
+    timings = {}
+    for doc, text in load_corpus().items():
+        if outputs:
+            with open(os.path.join(EXPECTED_DIR, f"{doc}.json"), 'w', encoding='utf-8') as f:
+                json.dump(parse(parser, text), f, indent=2, ensure_ascii=False)
+                f.write('\n')
+        timings[doc] = round(time_parse(parser, text, repeat), 4)
+    with open(TIMINGS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(timings, f, indent=2)
+        f.write('\n')
+    print(f"updated {'expected outputs and ' if outputs else ''}timings for {len(timings)} documents")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--repeat', type=int, default=20, help='parse runs per document for timing')
+    arg_parser.add_argument('--verbose', action='store_true', help='print expected vs actual for changed fields')
+    arg_parser.add_argument('--max-slowdown', type=float,
+                            help='fail when a document parses more than this many times slower than baseline')
+    group = arg_parser.add_mutually_exclusive_group()
+    group.add_argument('--update', action='store_true', help='accept current outputs and timings as golden')
+    group.add_argument('--update-timings', action='store_true', help='re-baseline timings only')
+    args = arg_parser.parse_args()
+
+    if args.update or args.update_timings:
+        update(args.repeat, outputs=args.update)
+        return
+    sys.exit(check(args.repeat, args.verbose, args.max_slowdown))
+
+
+if __name__ == '__main__':
+    main()
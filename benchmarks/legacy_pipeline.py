@@ -0,0 +1,411 @@
+"""Frozen copies of the parser and generator from before the typed Resume model
+
+Used only by resume_model_bench as the "legacy" baseline. _parse_text and
+the structured extractors return plain dicts exactly as they did (the
+string extractors are inherited unchanged), and LegacyPortfolioGenerator
+copies every entry into new dicts as the old generator did. Do not update
+this file when the parser changes; it exists to keep the comparison honest.
+"""
+import logging
+import re
+from typing import Any, Dict, List
+
+from resume_parser import ResumeParser
+
+
+class LegacyResumeParser(ResumeParser):
+    def _parse_text(self, text: str) -> Dict:
+        """Parse extracted text and identify sections"""
+        parsed_data = {
+            'name': self._extract_name(text),
+            'email': self._extract_email(text),
+            'phone': self._extract_phone(text),
+            'location': self._extract_location(text),
+            'linkedin': self._extract_linkedin(text),
+            'github': self._extract_github(text),
+            'portfolio_url': self._extract_portfolio_url(text),
+            'summary': self._extract_summary(text),
+            'skills': self._extract_skills(text),
+            'experience': self._extract_experience(text),
+            'projects': self._extract_projects(text),
+            'education': self._extract_education(text),
+            'certifications': self._extract_certifications(text),
+            'achievements': self._extract_achievements(text),
+            'languages': self._extract_languages(text),
+            'interests': self._extract_interests(text),
+            'raw_text': text
+        }
+        
+        return parsed_data
+
+    
+    def _extract_experience(self, text: str) -> List[Dict]:
+        """Extract work experience from resume text"""
+        experience = []
+        exp_keywords = ['experience', 'work history', 'employment', 'professional experience']
+        lines = text.split('\n')
+        
+        for i, line in enumerate(lines):
+            if any(keyword in line.lower() for keyword in exp_keywords):
+                # Extract experience entries
+                current_job = {}
+                for j in range(i + 1, len(lines)):
+                    exp_line = lines[j].strip()
+                    if not exp_line:
+                        continue
+                    if any(section in exp_line.lower() 
+                          for section in ['education', 'skills', 'projects']):
+                        break
+                    
+                    # Simple job parsing
+                    if current_job and ('company' not in current_job or 'position' not in current_job):
+                        if len(exp_line.split()) <= 6:  # Likely a job title or company
+                            if 'position' not in current_job:
+                                current_job['position'] = exp_line
+                            elif 'company' not in current_job:
+                                current_job['company'] = exp_line
+                    elif len(experience) < 5:  # Limit to 5 jobs
+                        if current_job:
+                            experience.append(current_job)
+                        current_job = {'position': exp_line, 'description': ''}
+                
+                if current_job:
+                    experience.append(current_job)
+                break
+        
+        return experience
+
+    
+    def _extract_education(self, text: str) -> List[Dict]:
+        """Extract education information from resume text"""
+        education = []
+        edu_keywords = ['education', 'academic', 'degree', 'university', 'college']
+        lines = text.split('\n')
+        
+        for i, line in enumerate(lines):
+            if any(keyword in line.lower() for keyword in edu_keywords):
+                # Extract education entries
+                for j in range(i + 1, min(i + 10, len(lines))):
+                    edu_line = lines[j].strip()
+                    if not edu_line:
+                        continue
+                    if any(section in edu_line.lower() 
+                          for section in ['experience', 'skills', 'work']):
+                        break
+                    
+                    if len(edu_line.split()) > 2:  # Likely an education entry
+                        education.append({
+                            'degree': edu_line,
+                            'institution': '',
+                            'year': ''
+                        })
+                break
+        
+        return education
+
+    
+    def _extract_projects(self, text: str) -> List[Dict]:
+        """Extract projects from resume text"""
+        projects = []
+        project_keywords = ['projects', 'portfolio', 'personal projects', 'key projects']
+        lines = text.split('\n')
+        
+        for i, line in enumerate(lines):
+            if any(keyword in line.lower() for keyword in project_keywords):
+                # Extract project entries
+                for j in range(i + 1, min(i + 15, len(lines))):
+                    project_line = lines[j].strip()
+                    if not project_line:
+                        continue
+                    if any(section in project_line.lower() 
+                          for section in ['experience', 'education', 'skills', 'work']):
+                        break
+                    
+                    # Look for project patterns
+                    if len(project_line) > 10 and len(projects) < 6:
+                        project = {
+                            'title': project_line,
+                            'description': '',
+                            'technologies': [],
+                            'url': ''
+                        }
+                        
+                        # Look for technologies in next few lines
+                        for k in range(j + 1, min(j + 3, len(lines))):
+                            if k < len(lines):
+                                next_line = lines[k].strip()
+                                if any(tech_word in next_line.lower() for tech_word in ['tech', 'built', 'using', 'language']):
+                                    tech_list = re.split(r'[,•·\-]', next_line)
+                                    project['technologies'] = [t.strip() for t in tech_list if t.strip()][:5]
+                                    break
+                                elif next_line and len(next_line) > 20:
+                                    project['description'] = next_line
+                        
+                        projects.append(project)
+                break
+        
+        return projects
+
+    
+    def _extract_certifications(self, text: str) -> List[Dict]:
+        """Extract certifications from resume text"""
+        certifications = []
+        cert_keywords = ['certification', 'certificate', 'licensed', 'certified', 'credentials']
+        lines = text.split('\n')
+        
+        for i, line in enumerate(lines):
+            if any(keyword in line.lower() for keyword in cert_keywords):
+                # Extract certification entries
+                for j in range(i + 1, min(i + 10, len(lines))):
+                    cert_line = lines[j].strip()
+                    if not cert_line:
+                        continue
+                    if any(section in cert_line.lower() 
+                          for section in ['experience', 'education', 'skills', 'work']):
+                        break
+                    
+                    if len(cert_line) > 5 and len(certifications) < 8:
+                        # Extract year if present
+                        year_match = re.search(r'(20\d{2})', cert_line)
+                        year = year_match.group(1) if year_match else ''
+                        
+                        certifications.append({
+                            'name': cert_line,
+                            'issuer': '',
+                            'year': year
+                        })
+                break
+        
+        return certifications
+
+    
+    def _extract_languages(self, text: str) -> List[Dict]:
+        """Extract languages from resume text"""
+        languages = []
+        language_keywords = ['language', 'fluent', 'native', 'proficient']
+        
+        # Common languages list for better detection
+        common_languages = [
+            'english', 'spanish', 'french', 'german', 'italian', 'portuguese', 'russian',
+            'chinese', 'japanese', 'korean', 'arabic', 'hindi', 'dutch', 'swedish'
+        ]
+        
+        lines = text.split('\n')
+        for i, line in enumerate(lines):
+            if any(keyword in line.lower() for keyword in language_keywords):
+                # Extract language entries
+                for j in range(i, min(i + 5, len(lines))):
+                    lang_line = lines[j].strip().lower()
+                    for lang in common_languages:
+                        if lang in lang_line and len(languages) < 5:
+                            proficiency = 'Fluent'
+                            if 'native' in lang_line:
+                                proficiency = 'Native'
+                            elif 'basic' in lang_line:
+                                proficiency = 'Basic'
+                            elif 'intermediate' in lang_line:
+                                proficiency = 'Intermediate'
+                            
+                            languages.append({
+                                'name': lang.title(),
+                                'proficiency': proficiency
+                            })
+                break
+        
+        return languages
+
+
+class LegacyPortfolioGenerator:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+    
+    def generate_portfolio(self, parsed_data: Dict) -> Dict[str, Any]:
+        """Generate portfolio data structure from parsed resume data"""
+        try:
+            portfolio_data = {
+                # Header/Contact Information
+                'name': self._clean_text(parsed_data.get('name', 'Portfolio Owner')),
+                'email': parsed_data.get('email', ''),
+                'phone': parsed_data.get('phone', ''),
+                'location': self._clean_text(parsed_data.get('location', '')),
+                'linkedin': parsed_data.get('linkedin', ''),
+                'github': parsed_data.get('github', ''),
+                'portfolio_url': parsed_data.get('portfolio_url', ''),
+                
+                # Professional Summary
+                'summary': self._clean_text(parsed_data.get('summary', '')),
+                
+                # Skills
+                'skills': self._process_skills(parsed_data.get('skills', [])),
+                
+                # Work Experience
+                'experience': self._process_experience(parsed_data.get('experience', [])),
+                
+                # Projects
+                'projects': self._process_projects(parsed_data.get('projects', [])),
+                
+                # Education
+                'education': self._process_education(parsed_data.get('education', [])),
+                
+                # Certifications
+                'certifications': self._process_certifications(parsed_data.get('certifications', [])),
+                
+                # Achievements
+                'achievements': parsed_data.get('achievements', []),
+                
+                # Languages
+                'languages': parsed_data.get('languages', []),
+                
+                # Interests
+                'interests': parsed_data.get('interests', []),
+                
+                'color_scheme': 'professional'  # Default color scheme
+            }
+            
+            # Generate a professional summary if none exists
+            if not portfolio_data['summary']:
+                portfolio_data['summary'] = self._generate_default_summary(portfolio_data)
+            
+            return portfolio_data
+            
+        except Exception as e:
+            self.logger.error(f"Error generating portfolio: {str(e)}")
+            return self._get_default_portfolio()
+    
+    def _clean_text(self, text: str) -> str:
+        """Clean and format text"""
+        if not text:
+            return ""
+        return ' '.join(text.split())
+    
+    def _process_skills(self, skills: list) -> list:
+        """Process and clean skills list"""
+        processed_skills = []
+        for skill in skills:
+            if isinstance(skill, str):
+                skill = skill.strip()
+                if skill and len(skill) > 1 and skill not in processed_skills:
+                    processed_skills.append(skill)
+        
+        # If no skills found, add some default categories
+        if not processed_skills:
+            processed_skills = ['Communication', 'Problem Solving', 'Team Work', 'Leadership']
+        
+        return processed_skills[:15]  # Limit to 15 skills
+    
+    def _process_experience(self, experience: list) -> list:
+        """Process work experience entries"""
+        processed_experience = []
+        
+        for exp in experience:
+            if isinstance(exp, dict):
+                processed_exp = {
+                    'position': self._clean_text(exp.get('position', 'Professional Role')),
+                    'company': self._clean_text(exp.get('company', 'Company Name')),
+                    'duration': exp.get('duration', ''),
+                    'description': self._clean_text(exp.get('description', ''))
+                }
+                processed_experience.append(processed_exp)
+        
+        # Add default experience if none found
+        if not processed_experience:
+            processed_experience = [{
+                'position': 'Professional Experience',
+                'company': 'Previous Employer',
+                'duration': '',
+                'description': 'Demonstrated professional skills and capabilities in previous roles.'
+            }]
+        
+        return processed_experience
+    
+    def _process_education(self, education: list) -> list:
+        """Process education entries"""
+        processed_education = []
+        
+        for edu in education:
+            if isinstance(edu, dict):
+                processed_edu = {
+                    'degree': self._clean_text(edu.get('degree', 'Education')),
+                    'institution': self._clean_text(edu.get('institution', '')),
+                    'year': edu.get('year', '')
+                }
+                processed_education.append(processed_edu)
+        
+        # Add default education if none found
+        if not processed_education:
+            processed_education = [{
+                'degree': 'Educational Background',
+                'institution': 'Academic Institution',
+                'year': ''
+            }]
+        
+        return processed_education
+    
+    def _process_projects(self, projects: list) -> list:
+        """Process project entries"""
+        processed_projects = []
+        
+        for project in projects:
+            if isinstance(project, dict):
+                processed_project = {
+                    'title': self._clean_text(project.get('title', 'Project')),
+                    'description': self._clean_text(project.get('description', '')),
+                    'technologies': project.get('technologies', []),
+                    'url': project.get('url', '')
+                }
+                processed_projects.append(processed_project)
+        
+        return processed_projects
+    
+    def _process_certifications(self, certifications: list) -> list:
+        """Process certification entries"""
+        processed_certifications = []
+        
+        for cert in certifications:
+            if isinstance(cert, dict):
+                processed_cert = {
+                    'name': self._clean_text(cert.get('name', 'Certification')),
+                    'issuer': self._clean_text(cert.get('issuer', '')),
+                    'year': cert.get('year', '')
+                }
+                processed_certifications.append(processed_cert)
+        
+        return processed_certifications
+    
+    def _generate_default_summary(self, portfolio_data: Dict) -> str:
+        """Generate a default professional summary"""
+        name = portfolio_data.get('name', 'Professional')
+        skills = portfolio_data.get('skills', [])
+        
+        if skills:
+            summary = f"Experienced professional with expertise in {', '.join(skills[:3])}. "
+            summary += "Proven track record of delivering results and contributing to team success. "
+            summary += "Seeking opportunities to leverage skills and experience in a dynamic environment."
+        else:
+            summary = f"Dedicated professional with a strong background in various industries. "
+            summary += "Committed to excellence and continuous learning. "
+            summary += "Ready to contribute skills and expertise to achieve organizational goals."
+        
+        return summary
+    
+    def _get_default_portfolio(self) -> Dict[str, Any]:
+        """Return default portfolio structure"""
+        return {
+            'name': 'Portfolio Owner',
+            'email': '',
+            'phone': '',
+            'summary': 'Professional with diverse experience and skills.',
+            'skills': ['Communication', 'Problem Solving', 'Team Work'],
+            'experience': [{
+                'position': 'Professional Role',
+                'company': 'Previous Company',
+                'duration': '',
+                'description': 'Contributed to team success and organizational goals.'
+            }],
+            'education': [{
+                'degree': 'Educational Background',
+                'institution': 'Academic Institution',
+                'year': ''
+            }],
+            'color_scheme': 'professional'
+        }
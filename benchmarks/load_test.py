@@ -0,0 +1,426 @@
+"""Replay upload/preview/download traffic against a locally started app
+
+Starts the app built by create_app (under gunicorn or the Flask dev
+server) in a scratch directory, then drives a weighted mix of routes at
+one or more concurrency levels. Each level reports throughput, latency
+percentiles per route, error rates and server RSS over time; the sweep
+reports the knee, the last level before extra concurrency stops buying
+throughput. Everything runs offline on the synthetic corpus.
+
+    python -m benchmarks.load_test --concurrency 1,2,4,8,16 --duration 20
+    python -m benchmarks.load_test --server gunicorn --worker-class gthread --workers 4
+"""
+import argparse
+import html
+import http.client
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from benchmarks.synthetic_corpus import write_docx_corpus
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUTES = ('upload', 'preview', 'download')
+PREVIEW_LOCATION = re.compile(r'/preview/(\d+)')
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse 'upload=1,preview=6,download=3' into route weights"""
+    mix = {}
+    for part in value.split(','):
+        route, _, weight = part.partition('=')
+        route = route.strip()
+        if route not in ROUTES:
+            raise argparse.ArgumentTypeError(f"unknown route '{route}', expected one of {', '.join(ROUTES)}")
+        mix[route] = float(weight or 1)
+    return mix
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _process_tree_rss(root_pid: int) -> Dict[int, int]:
+    """RSS in bytes of a process and its descendants, read from /proc (Linux only)"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    rss = {}
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        try:
+            with open(f'/proc/{pid}/status', 'r') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        rss[pid] = int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+        stack.extend(children.get(pid, []))
+    return rss
+
+
+class AppServer:
+    """Run the app from create_app in a scratch directory
+
+    The directory is removed on exit unless ``keep_workdir`` is set.
+    """
+
+    def __init__(self, server: str, workers: int, worker_class: str, threads: int, keep_workdir: bool = False):
+        self.server = server
+        self.workers = workers
+        self.worker_class = worker_class
+        self.threads = threads
+        self.keep_workdir = keep_workdir
+        self.port = _free_port()
+        self.workdir = tempfile.mkdtemp(prefix='portfolio_load_')
+        self.log_path = os.path.join(self.workdir, 'server.log')
+        self.process = None
+
+    def __enter__(self) -> 'AppServer':
+        env = dict(os.environ)
+        env.update({
+            'PYTHONPATH': REPO_ROOT + os.pathsep + env.get('PYTHONPATH', ''),
+            'DATABASE_URL': 'sqlite:///' + os.path.join(self.workdir, 'load_test.db'),
+            'UPLOAD_FOLDER': os.path.join(self.workdir, 'uploads'),
+            'GENERATED_FOLDER': os.path.join(self.workdir, 'generated'),
+        })
+        if self.server == 'gunicorn':
+            command = [
+                sys.executable, '-m', 'gunicorn', 'app:create_app()',
+                '--bind', f'127.0.0.1:{self.port}',
+                '--workers', str(self.workers),
+                '--worker-class', self.worker_class,
+                '--threads', str(self.threads),
+                '--log-level', 'warning',
+            ]
+        else:
+            command = [
+                sys.executable, '-c',
+                'from app import create_app; '
+                f'create_app().run(host="127.0.0.1", port={self.port}, threaded=True, use_reloader=False)',
+            ]
+        try:
+            # Log to a file: an unread pipe fills up and blocks the server
+            with open(self.log_path, 'wb') as log:
+                self.process = subprocess.Popen(command, cwd=self.workdir, env=env,
+                                                stdout=subprocess.DEVNULL, stderr=log)
+            self._wait_ready()
+        except BaseException:
+            self.__exit__()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.keep_workdir:
+            print(f"kept work directory {self.workdir}")
+        else:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _wait_ready(self, timeout: float = 30.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Server exited early: {self.server_log()}")
+            try:
+                conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=2)
+                conn.request('GET', '/')
+                if conn.getresponse().status == 200:
+                    return
+            except OSError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError(f"Server did not become ready: {self.server_log()}")
+
+    def server_log(self) -> str:
+        try:
+            with open(self.log_path, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read()
+        except OSError:
+            return ''
+
+    def rss(self) -> Dict[int, int]:
+        if not os.path.isdir('/proc'):
+            return {}
+        return _process_tree_rss(self.process.pid)
+
+
+class LoadClient:
+    """One simulated user issuing requests in a closed loop"""
+
+    def __init__(self, port: int, corpus: List[bytes], portfolio_ids: List[int], lock: threading.Lock,
+                 timeout: float = 60.0):
+        self.port = port
+        self.corpus = corpus
+        self.portfolio_ids = portfolio_ids
+        self.lock = lock
+        self.timeout = timeout
+
+    def request(self, route: str, rng: random.Random):
+        """Issue one request; return (ok, detail)"""
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=self.timeout)
+        try:
+            if route == 'upload':
+                return self._upload(conn, rng)
+            with self.lock:
+                portfolio_id = rng.choice(self.portfolio_ids) if self.portfolio_ids else None
+            if portfolio_id is None:
+                return self._upload(conn, rng)
+            path = f'/preview/{portfolio_id}' if route == 'preview' else f'/download/{portfolio_id}'
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            return response.status == 200, response.status
+        finally:
+            conn.close()
+
+    def _upload(self, conn: http.client.HTTPConnection, rng: random.Random):
+        boundary = uuid.UUID(int=rng.getrandbits(128)).hex
+        document = rng.choice(self.corpus)
+        body = b''.join([
+            f'--{boundary}\r\n'.encode(),
+            b'Content-Disposition: form-data; name="resume"; filename="resume.docx"\r\n',
+            b'Content-Type: application/vnd.openxmlformats-officedocument.wordprocessingml.document\r\n\r\n',
+            document,
+            f'\r\n--{boundary}--\r\n'.encode(),
+        ])
+        conn.request('POST', '/upload', body=body,
+                     headers={'Content-Type': f'multipart/form-data; boundary={boundary}'})
+        response = conn.getresponse()
+        response.read()
+        match = PREVIEW_LOCATION.search(response.getheader('Location') or '')
+        if response.status != 302 or not match:
+            return False, response.status
+        with self.lock:
+            self.portfolio_ids.append(int(match.group(1)))
+        return True, response.status
+
+
+def run_level(server: AppServer, client: LoadClient, concurrency: int, duration: float,
+              mix: Dict[str, float], seed: int, sample_interval: float) -> Dict:
+    """Drive the server at one concurrency level for ``duration`` seconds
+
+    Only requests that complete inside the window are counted; requests
+    still in flight when it closes are reported as ``late`` and left out
+    of throughput and latency.
+    """
+    routes, weights = zip(*mix.items())
+    latencies = {route: [] for route in ROUTES}
+    errors = {route: 0 for route in ROUTES}
+    late = 0
+    results_lock = threading.Lock()
+    stop = threading.Event()
+    rss_samples = []
+    started = time.monotonic()
+    window_end = started + duration
+
+    def user(index: int):
+        nonlocal late
+        rng = random.Random(seed * 1000 + index)
+        while not stop.is_set():
+            route = rng.choices(routes, weights)[0]
+            begin = time.perf_counter()
+            try:
+                ok, _ = client.request(route, rng)
+            except (OSError, http.client.HTTPException):
+                ok = False
+            elapsed = time.perf_counter() - begin
+            with results_lock:
+                if time.monotonic() > window_end:
+                    late += 1
+                    continue
+                latencies[route].append(elapsed)
+                if not ok:
+                    errors[route] += 1
+
+    def sample_rss():
+        while not stop.is_set():
+            rss = server.rss()
+            if rss:
+                rss_samples.append({
+                    't': round(time.monotonic() - started, 2),
+                    'total_mb': round(sum(rss.values()) / 2**20, 1),
+                    'max_worker_mb': round(max(rss.values()) / 2**20, 1),
+                })
+            stop.wait(sample_interval)
+
+    threads = [threading.Thread(target=user, args=(i,), daemon=True) for i in range(concurrency)]
+    threads.append(threading.Thread(target=sample_rss, daemon=True))
+    for thread in threads:
+        thread.start()
+    time.sleep(max(0.0, window_end - time.monotonic()))
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    total = sum(len(values) for values in latencies.values())
+    routes_report = {}
+    for route in ROUTES:
+        values = latencies[route]
+        if not values:
+            continue
+        routes_report[route] = {
+            'requests': len(values),
+            'errors': errors[route],
+            'error_rate': errors[route] / len(values),
+            'p50_ms': percentile(values, 50) * 1000,
+            'p90_ms': percentile(values, 90) * 1000,
+            'p95_ms': percentile(values, 95) * 1000,
+            'p99_ms': percentile(values, 99) * 1000,
+            'max_ms': max(values) * 1000,
+        }
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        'concurrency': concurrency,
+        'duration_s': duration,
+        'requests': total,
+        'late': late,
+        'throughput_rps': total / duration if duration else 0.0,
+        'error_rate': sum(errors.values()) / total if total else 0.0,
+        'p95_ms': percentile(all_latencies, 95) * 1000,
+        'routes': routes_report,
+        'rss': rss_samples,
+    }
+
+
+def find_knee(levels: List[Dict], min_gain: float = 0.10) -> Optional[int]:
+    """Last concurrency level before throughput gains drop below ``min_gain``"""
+    for previous, current in zip(levels, levels[1:]):
+        if previous['throughput_rps'] and \
+                current['throughput_rps'] < previous['throughput_rps'] * (1 + min_gain):
+            return previous['concurrency']
+    return levels[-1]['concurrency'] if levels else None
+
+
+def render_html(report: Dict) -> str:
+    """Render the report as a small standalone HTML page"""
+    esc = html.escape
+    rows = []
+    for level in report['levels']:
+        peak_rss = max((s['total_mb'] for s in level['rss']), default=0)
+        rows.append(
+            f"<tr><td>{level['concurrency']}</td><td>{level['requests']}</td><td>{level['late']}</td>"
+            f"<td>{level['throughput_rps']:.1f}</td><td>{level['p95_ms']:.0f}</td>"
+            f"<td>{level['error_rate']:.1%}</td><td>{peak_rss:.0f}</td></tr>"
+        )
+    route_tables = []
+    for level in report['levels']:
+        route_rows = ''.join(
+            f"<tr><td>{esc(route)}</td><td>{stats['requests']}</td><td>{stats['p50_ms']:.0f}</td>"
+            f"<td>{stats['p90_ms']:.0f}</td><td>{stats['p99_ms']:.0f}</td><td>{stats['max_ms']:.0f}</td>"
+            f"<td>{stats['error_rate']:.1%}</td></tr>"
+            for route, stats in level['routes'].items()
+        )
+        rss = ' '.join(f"{s['t']:.0f}s:{s['total_mb']:.0f}MB" for s in level['rss'])
+        route_tables.append(
+            f"<h3>Concurrency {level['concurrency']}</h3>"
+            "<table><tr><th>Route</th><th>Requests</th><th>p50 ms</th><th>p90 ms</th><th>p99 ms</th>"
+            f"<th>Max ms</th><th>Errors</th></tr>{route_rows}</table>"
+            f"<p class=\"rss\">RSS: {esc(rss) or 'n/a'}</p>"
+        )
+    config = esc(json.dumps(report['config'], sort_keys=True))
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"UTF-8\"><title>Load test report</title>"
+        "<style>body{font-family:sans-serif;margin:2rem;color:#2d3748}table{border-collapse:collapse;"
+        "margin-bottom:1rem}td,th{border:1px solid #e2e8f0;padding:.3rem .7rem;text-align:right}"
+        "th{background:#f7fafc}.rss{color:#718096;font-size:.85rem}</style></head><body>"
+        f"<h1>Load test report</h1><p><code>{config}</code></p>"
+        f"<p><strong>Knee:</strong> concurrency {report['knee']}</p>"
+        "<table><tr><th>Concurrency</th><th>Requests</th><th>Late</th><th>Req/s</th><th>p95 ms</th>"
+        f"<th>Errors</th><th>Peak RSS MB</th></tr>{''.join(rows)}</table>"
+        f"<h2>Per route</h2>{''.join(route_tables)}</body></html>"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--server', choices=('gunicorn', 'flask'), default='gunicorn')
+    arg_parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+    arg_parser.add_argument('--worker-class', default='sync', help='gunicorn worker class (sync, gthread, gevent)')
+    arg_parser.add_argument('--threads', type=int, default=1, help='threads per gunicorn worker')
+    arg_parser.add_argument('--concurrency', default='1,2,4,8', help='comma-separated levels to sweep')
+    arg_parser.add_argument('--duration', type=float, default=15.0, help='seconds per level')
+    arg_parser.add_argument('--request-timeout', type=float,
+                            help='client timeout per request in seconds (default: half of --duration)')
+    arg_parser.add_argument('--mix', type=parse_mix, default=parse_mix('upload=1,preview=6,download=3'))
+    arg_parser.add_argument('--corpus-size', type=int, default=50)
+    arg_parser.add_argument('--warmup-uploads', type=int, default=10)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--sample-interval', type=float, default=0.5, help='seconds between RSS samples')
+    arg_parser.add_argument('--out', default='load_report', help='output path prefix for .json and .html')
+    arg_parser.add_argument('--keep-workdir', action='store_true', help='keep the scratch directory for inspection')
+    args = arg_parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(',')]
+    request_timeout = args.request_timeout or args.duration / 2
+    with AppServer(args.server, args.workers, args.worker_class, args.threads, args.keep_workdir) as server:
+        paths = write_docx_corpus(os.path.join(server.workdir, 'corpus'), args.corpus_size, args.seed)
+        corpus = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                corpus.append(f.read())
+        client = LoadClient(server.port, corpus, [], threading.Lock(), request_timeout)
+
+        warmup_rng = random.Random(args.seed)
+        for _ in range(args.warmup_uploads):
+            client.request('upload', warmup_rng)
+
+        results = []
+        for concurrency in levels:
+            result = run_level(server, client, concurrency, args.duration, args.mix, args.seed,
+                               args.sample_interval)
+            results.append(result)
+            print(f"c={concurrency:<4} {result['throughput_rps']:8.1f} req/s  "
+                  f"p95 {result['p95_ms']:7.0f} ms  errors {result['error_rate']:.1%}  late {result['late']}")
+
+    report = {
+        'config': {key: value for key, value in vars(args).items() if key != 'out'},
+        'knee': find_knee(results),
+        'levels': results,
+    }
+    with open(f"{args.out}.json", 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    with open(f"{args.out}.html", 'w', encoding='utf-8') as f:
+        f.write(render_html(report))
+    print(f"knee at concurrency {report['knee']}; wrote {args.out}.json and {args.out}.html")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Memory and throughput of the typed Resume model on a synthetic batch
+
+Compares the slotted Resume pipeline (parse -> generate in place) with a
+frozen copy of the previous pipeline (benchmarks/legacy_pipeline.py), where
+the parser returned nested dicts and the generator copied every entry into a
+second set of dicts.
+
+    python -m benchmarks.resume_model_bench --count 10000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.legacy_pipeline import LegacyPortfolioGenerator, LegacyResumeParser
+from benchmarks.synthetic_corpus import iter_resume_texts
+from portfolio_generator import PortfolioGenerator
+from resume_models import msgpack
+from resume_parser import ResumeParser
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def run(count: int, seed: int) -> dict:
+    texts = list(iter_resume_texts(count, seed))
+    parser = ResumeParser()
+    generator = PortfolioGenerator()
+    legacy_parser = LegacyResumeParser()
+    legacy_generator = LegacyPortfolioGenerator()
+    resumes = [parser._parse_text(text) for text in texts]
+    for resume in resumes:
+        resume.to_row()  # force the lazy extractors so generate is timed alone
+    legacy = [legacy_parser._parse_text(text) for text in texts]
+
+    def build_typed():
+        batch = [parser._parse_text(text) for text in texts]
+        return batch, [generator.generate_portfolio(resume) for resume in batch]
+
+    def build_legacy():
+        batch = [legacy_parser._parse_text(text) for text in texts]
+        return batch, [legacy_generator.generate_portfolio(parsed) for parsed in batch]
+
+    _, typed_time, typed_mem = _measure(build_typed)
+    _, legacy_time, legacy_mem = _measure(build_legacy)
+
+    start = time.perf_counter()
+    for resume in resumes:
+        generator.generate_portfolio(resume)
+    typed_generate = time.perf_counter() - start
+    start = time.perf_counter()
+    for parsed in legacy:
+        legacy_generator.generate_portfolio(parsed)
+    legacy_generate = time.perf_counter() - start
+
+    report = {
+        'count': count,
+        'typed_bytes_per_resume': typed_mem / count,
+        'legacy_bytes_per_resume': legacy_mem / count,
+        'typed_pipeline_per_sec': count / typed_time,
+        'legacy_pipeline_per_sec': count / legacy_time,
+        'typed_generate_per_sec': count / typed_generate,
+        'legacy_generate_per_sec': count / legacy_generate,
+    }
+
+    start = time.perf_counter()
+    payloads = [resume.to_json() for resume in resumes]
+    report['json_bytes_per_resume'] = sum(len(p.encode('utf-8')) for p in payloads) / count
+    report['json_dumps_per_sec'] = count / (time.perf_counter() - start)
+    if msgpack is not None:
+        start = time.perf_counter()
+        packed = [resume.to_msgpack() for resume in resumes]
+        report['msgpack_bytes_per_resume'] = sum(len(p) for p in packed) / count
+        report['msgpack_dumps_per_sec'] = count / (time.perf_counter() - start)
+    return report
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--count', type=int, default=10000)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    for key, value in run(args.count, args.seed).items():
+        print(f"{key:28} {value:,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Deterministic synthetic resumes for benchmarks and load tests
+
+Every resume is built from a seeded random.Random so the same seed always
+yields the same corpus. Nothing here describes a real person.
+"""
+import os
+import random
+from typing import Iterator, List
+
+FIRST_NAMES = ['Alex', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Avery', 'Quinn', 'Rowan', 'Sage']
+LAST_NAMES = ['Rivera', 'Chen', 'Okafor', 'Novak', 'Haddad', 'Larsen', 'Moreau', 'Tanaka', 'Silva', 'Kowalski']
+CITIES = ['Austin, TX', 'Denver, CO', 'Seattle, WA', 'Boston, MA', 'Portland, OR', 'Raleigh, NC']
+SKILLS = ['Python', 'Flask', 'SQL', 'Docker', 'Kubernetes', 'React', 'TypeScript', 'AWS',
+          'PostgreSQL', 'Redis', 'GraphQL', 'Go', 'Terraform', 'Linux', 'CI/CD', 'Pandas']
+TITLES = ['Software Engineer', 'Senior Developer', 'Data Analyst', 'Backend Engineer', 'Tech Lead']
+COMPANIES = ['Acme Corp', 'Globex Inc', 'Initech', 'Umbrella Labs', 'Stark Systems', 'Wayne Analytics']
+DEGREES = ['Bachelor of Science in Computer Science', 'Master of Science in Data Science',
+           'Bachelor of Arts in Mathematics']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College']
+CERTS = ['AWS Certified Solutions Architect', 'Certified Kubernetes Administrator',
+         'Google Professional Data Engineer', 'Scrum Master Certification']
+LANGUAGES = ['English', 'Spanish', 'French', 'German', 'Japanese', 'Portuguese']
+INTERESTS = ['Hiking', 'Photography', 'Chess', 'Cycling', 'Cooking', 'Open source']
+
+
+def synthetic_resume_text(rng: random.Random) -> str:
+    """Render one plain-text resume laid out the way ResumeParser expects"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}{rng.randint(1, 999)}@example.com",
+        f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        rng.choice(CITIES),
+        f"linkedin.com/in/{first.lower()}{last.lower()}",
+        f"github.com/{first.lower()}-{last.lower()}",
+        "",
+        "Summary",
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience building reliable services.",
+        "Focused on clean code, measurable results and mentoring teammates.",
+        "",
+        "Technical Skills",
+        ", ".join(rng.sample(SKILLS, rng.randint(4, 10))),
+        "",
+        "Professional Experience",
+    ]
+    for _ in range(rng.randint(1, 4)):
+        start = rng.randint(2010, 2022)
+        lines += [
+            rng.choice(TITLES),
+            f"{rng.choice(COMPANIES)} {start} to {start + rng.randint(1, 3)}",
+            f"Delivered {rng.randint(2, 9)} production features and cut latency by {rng.randint(10, 60)} percent.",
+        ]
+    lines += ["", "Projects"]
+    for _ in range(rng.randint(0, 3)):
+        lines += [
+            f"{rng.choice(['Realtime', 'Open', 'Smart', 'Tiny'])} {rng.choice(['Dashboard', 'Tracker', 'Planner'])} App",
+            f"Built using {', '.join(rng.sample(SKILLS, 3))}",
+        ]
+    lines += ["", "Education"]
+    for _ in range(rng.randint(1, 2)):
+        lines.append(f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)} {rng.randint(2005, 2020)}")
+    lines += ["", "Certifications"]
+    for _ in range(rng.randint(0, 2)):
+        lines.append(f"{rng.choice(CERTS)} {rng.randint(2015, 2024)}")
+    lines += ["", "Languages"]
+    lines.append(", ".join(f"{lang} ({rng.choice(['Native', 'Fluent', 'Intermediate', 'Basic'])})"
+                           for lang in rng.sample(LANGUAGES, rng.randint(1, 3))))
+    lines += ["", "Interests", ", ".join(rng.sample(INTERESTS, 3))]
+    return "\n".join(lines) + "\n"
+
+
+def iter_resume_texts(count: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield synthetic_resume_text(rng)
+
+
+def write_docx_corpus(directory: str, count: int, seed: int = 0) -> List[str]:
+    """Write the corpus as DOCX files and return their paths"""
+    from docx import Document
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i, text in enumerate(iter_resume_texts(count, seed)):
+        path = os.path.join(directory, f"synthetic_{seed}_{i:05d}.docx")
+        if not os.path.exists(path):
+            doc = Document()
+            for line in text.splitlines():
+                doc.add_paragraph(line)
+            doc.save(path)
+        paths.append(path)
+    return paths
@@ -1,58 +1,39 @@
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, List, Union
+
+from resume_models import Certification, Education, Experience, Project, Resume
 
 class PortfolioGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
-    def generate_portfolio(self, parsed_data: Dict) -> Dict[str, Any]:
-        """Generate portfolio data structure from parsed resume data"""
+    def generate_portfolio(self, parsed_data: Union[Resume, Dict]) -> Dict[str, Any]:
+        """Generate portfolio data structure from parsed resume data
+
+        The resume is cleaned in place and the returned template context
+        references its fields directly instead of copying them.
+        """
         try:
-            portfolio_data = {
-                # Header/Contact Information
-                'name': self._clean_text(parsed_data.get('name', 'Portfolio Owner')),
-                'email': parsed_data.get('email', ''),
-                'phone': parsed_data.get('phone', ''),
-                'location': self._clean_text(parsed_data.get('location', '')),
-                'linkedin': parsed_data.get('linkedin', ''),
-                'github': parsed_data.get('github', ''),
-                'portfolio_url': parsed_data.get('portfolio_url', ''),
-                
-                # Professional Summary
-                'summary': self._clean_text(parsed_data.get('summary', '')),
-                
-                # Skills
-                'skills': self._process_skills(parsed_data.get('skills', [])),
-                
-                # Work Experience
-                'experience': self._process_experience(parsed_data.get('experience', [])),
-                
-                # Projects
-                'projects': self._process_projects(parsed_data.get('projects', [])),
-                
-                # Education
-                'education': self._process_education(parsed_data.get('education', [])),
-                
-                # Certifications
-                'certifications': self._process_certifications(parsed_data.get('certifications', [])),
-                
-                # Achievements
-                'achievements': parsed_data.get('achievements', []),
-                
-                # Languages
-                'languages': parsed_data.get('languages', []),
-                
-                # Interests
-                'interests': parsed_data.get('interests', []),
-                
-                'color_scheme': 'professional'  # Default color scheme
-            }
-            
+            resume = parsed_data if isinstance(parsed_data, Resume) else Resume.from_dict(parsed_data)
+
+            # Header/Contact Information
+            resume.name = self._clean_text(resume.name) or 'Portfolio Owner'
+            resume.location = self._clean_text(resume.location)
+
+            # Professional Summary
+            resume.summary = self._clean_text(resume.summary)
+
+            self._process_skills(resume.skills)
+            self._process_experience(resume.experience)
+            self._process_projects(resume.projects)
+            self._process_education(resume.education)
+            self._process_certifications(resume.certifications)
+
             # Generate a professional summary if none exists
-            if not portfolio_data['summary']:
-                portfolio_data['summary'] = self._generate_default_summary(portfolio_data)
-            
-            return portfolio_data
+            if not resume.summary:
+                resume.summary = self._generate_default_summary(resume)
+
+            return resume.template_context(color_scheme='professional')  # Default color scheme
             
         except Exception as e:
             self.logger.error(f"Error generating portfolio: {str(e)}")
@@ -64,104 +45,75 @@ class PortfolioGenerator:
             return ""
         return ' '.join(text.split())
     
-    def _process_skills(self, skills: list) -> list:
-        """Process and clean skills list"""
+    def _process_skills(self, skills: List[str]) -> List[str]:
+        """Process and clean skills list in place"""
         processed_skills = []
+        seen = set()
         for skill in skills:
             if isinstance(skill, str):
                 skill = skill.strip()
-                if skill and len(skill) > 1 and skill not in processed_skills:
+                if skill and len(skill) > 1 and skill not in seen:
+                    seen.add(skill)
                     processed_skills.append(skill)
         
         # If no skills found, add some default categories
         if not processed_skills:
             processed_skills = ['Communication', 'Problem Solving', 'Team Work', 'Leadership']
         
-        return processed_skills[:15]  # Limit to 15 skills
+        skills[:] = processed_skills[:15]  # Limit to 15 skills
+        return skills
     
-    def _process_experience(self, experience: list) -> list:
-        """Process work experience entries"""
-        processed_experience = []
-        
+    def _process_experience(self, experience: List[Experience]) -> List[Experience]:
+        """Process work experience entries in place"""
         for exp in experience:
-            if isinstance(exp, dict):
-                processed_exp = {
-                    'position': self._clean_text(exp.get('position', 'Professional Role')),
-                    'company': self._clean_text(exp.get('company', 'Company Name')),
-                    'duration': exp.get('duration', ''),
-                    'description': self._clean_text(exp.get('description', ''))
-                }
-                processed_experience.append(processed_exp)
+            exp.position = self._clean_text(exp.position) or 'Professional Role'
+            exp.company = self._clean_text(exp.company) or 'Company Name'
+            exp.description = self._clean_text(exp.description)
         
         # Add default experience if none found
-        if not processed_experience:
-            processed_experience = [{
-                'position': 'Professional Experience',
-                'company': 'Previous Employer',
-                'duration': '',
-                'description': 'Demonstrated professional skills and capabilities in previous roles.'
-            }]
+        if not experience:
+            experience.append(Experience(
+                position='Professional Experience',
+                company='Previous Employer',
+                description='Demonstrated professional skills and capabilities in previous roles.'
+            ))
         
-        return processed_experience
+        return experience
     
-    def _process_education(self, education: list) -> list:
-        """Process education entries"""
-        processed_education = []
-        
+    def _process_education(self, education: List[Education]) -> List[Education]:
+        """Process education entries in place"""
         for edu in education:
-            if isinstance(edu, dict):
-                processed_edu = {
-                    'degree': self._clean_text(edu.get('degree', 'Education')),
-                    'institution': self._clean_text(edu.get('institution', '')),
-                    'year': edu.get('year', '')
-                }
-                processed_education.append(processed_edu)
+            edu.degree = self._clean_text(edu.degree) or 'Education'
+            edu.institution = self._clean_text(edu.institution)
         
         # Add default education if none found
-        if not processed_education:
-            processed_education = [{
-                'degree': 'Educational Background',
-                'institution': 'Academic Institution',
-                'year': ''
-            }]
+        if not education:
+            education.append(Education(
+                degree='Educational Background',
+                institution='Academic Institution'
+            ))
         
-        return processed_education
+        return education
     
-    def _process_projects(self, projects: list) -> list:
-        """Process project entries"""
-        processed_projects = []
-        
+    def _process_projects(self, projects: List[Project]) -> List[Project]:
+        """Process project entries in place"""
         for project in projects:
-            if isinstance(project, dict):
-                processed_project = {
-                    'title': self._clean_text(project.get('title', 'Project')),
-                    'description': self._clean_text(project.get('description', '')),
-                    'technologies': project.get('technologies', []),
-                    'url': project.get('url', '')
-                }
-                processed_projects.append(processed_project)
+            project.title = self._clean_text(project.title) or 'Project'
+            project.description = self._clean_text(project.description)
         
-        return processed_projects
+        return projects
     
-    def _process_certifications(self, certifications: list) -> list:
-        """Process certification entries"""
-        processed_certifications = []
-        
+    def _process_certifications(self, certifications: List[Certification]) -> List[Certification]:
+        """Process certification entries in place"""
         for cert in certifications:
-            if isinstance(cert, dict):
-                processed_cert = {
-                    'name': self._clean_text(cert.get('name', 'Certification')),
-                    'issuer': self._clean_text(cert.get('issuer', '')),
-                    'year': cert.get('year', '')
-                }
-                processed_certifications.append(processed_cert)
+            cert.name = self._clean_text(cert.name) or 'Certification'
+            cert.issuer = self._clean_text(cert.issuer)
         
-        return processed_certifications
+        return certifications
     
-    def _generate_default_summary(self, portfolio_data: Dict) -> str:
+    def _generate_default_summary(self, resume: Resume) -> str:
         """Generate a default professional summary"""
-        name = portfolio_data.get('name', 'Professional')
-        skills = portfolio_data.get('skills', [])
+        skills = resume.skills
         
         if skills:
             summary = f"Experienced professional with expertise in {', '.join(skills[:3])}. "
@@ -0,0 +1,93 @@
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from markupsafe import Markup
+
+
+@dataclass(frozen=True, slots=True)
+class Theme:
+    name: str
+    label: str
+    template: str
+    stylesheets: Tuple[str, ...]
+
+
+DEFAULT_THEME = 'professional'
+
+# Theme name -> Theme. Stylesheets live in static/themes/ and are inlined in order.
+THEMES: Dict[str, Theme] = {theme.name: theme for theme in (
+    Theme('professional', 'Professional', 'portfolio_template.html', ('professional.css',)),
+    Theme('midnight', 'Midnight', 'portfolio_template.html', ('professional.css', 'midnight.css')),
+    Theme('classic', 'Classic', 'portfolio_template_classic.html', ('classic.css',)),
+)}
+
+
+def register_theme(theme: Theme) -> None:
+    """Register (or replace) a portfolio theme"""
+    THEMES[theme.name] = theme
+
+
+def theme_filename(generated_filename: str, theme: str) -> str:
+    """Return the generated file that holds a portfolio rendered with ``theme``"""
+    if theme == DEFAULT_THEME:
+        return generated_filename
+    root, ext = os.path.splitext(generated_filename)
+    return f"{root}.{theme}{ext}"
+
+
+class ThemeRenderer:
+    """Render portfolio data with one or more themes
+
+    Compiled templates and inlined stylesheets are cached per theme, so each
+    theme is loaded from disk once per process. When the Jinja environment
+    auto-reloads (debug mode) the caches are bypassed.
+    """
+
+    def __init__(self, jinja_env, stylesheet_folder: str):
+        self.logger = logging.getLogger(__name__)
+        self.jinja_env = jinja_env
+        self.stylesheet_folder = stylesheet_folder
+        self._templates = {}
+        self._css = {}
+
+    def template(self, theme: str):
+        """Return the compiled template for a theme"""
+        template = self._templates.get(theme)
+        if template is None:
+            template = self.jinja_env.get_template(THEMES[theme].template)
+            if not self.jinja_env.auto_reload:
+                self._templates[theme] = template
+        return template
+
+    def css(self, theme: str) -> Markup:
+        """Return the theme's stylesheets concatenated, ready to inline"""
+        css = self._css.get(theme)
+        if css is None:
+            parts = []
+            for stylesheet in THEMES[theme].stylesheets:
+                with open(os.path.join(self.stylesheet_folder, stylesheet), 'r', encoding='utf-8') as f:
+                    parts.append(f.read().rstrip('\n'))
+            css = Markup('\n'.join(parts))
+            if not self.jinja_env.auto_reload:
+                self._css[theme] = css
+        return css
+
+    def render(self, portfolio_data: Dict, themes: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Render ``portfolio_data`` once per theme (all themes by default)"""
+        rendered = {}
+        for theme in (THEMES if themes is None else themes):
+            rendered[theme] = self.template(theme).render(
+                portfolio_data, theme_css=self.css(theme), color_scheme=theme
+            )
+        return rendered
+
+
+def get_renderer(app) -> ThemeRenderer:
+    """Return the ThemeRenderer bound to a Flask app, creating it on first use"""
+    renderer = app.extensions.get('portfolio_themes')
+    if renderer is None:
+        renderer = ThemeRenderer(app.jinja_env, os.path.join(app.static_folder, 'themes'))
+        app.extensions['portfolio_themes'] = renderer
+    return renderer
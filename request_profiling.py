@@ -0,0 +1,229 @@
+import cProfile
+import hmac
+import io
+import itertools
+import json
+import logging
+import os
+import pstats
+import shutil
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+TOKEN_HEADER = 'X-Profile-Token'
+TOKEN_PARAM = 'profile_token'
+TRACEMALLOC_FRAMES = 10
+TOP_ALLOCATIONS = 30
+TOP_FUNCTIONS = 40
+DEFAULT_MAX_CAPTURES = 20
+
+# One capture at a time per process: cProfile and tracemalloc are process-wide
+_capture_lock = threading.Lock()
+_request_counter = itertools.count(1)
+logger = logging.getLogger(__name__)
+
+
+class NullProfile:
+    """Stand-in used when a request is not being profiled"""
+    enabled = False
+
+    def stage(self, name: str):
+        return nullcontext()
+
+    def quarantine(self, file_path: str, filename: str):
+        pass
+
+    def finish(self):
+        pass
+
+
+class RequestProfile:
+    """cProfile + tracemalloc capture of one request's stages
+
+    Artifacts are written to ``<folder>/<id>/``: profile.pstats,
+    profile.txt (top functions), allocations.txt (top allocation sites),
+    meta.json and a quarantined copy of the uploaded file. Only the newest
+    ``max_captures`` captures are kept, since they hold users' resumes.
+
+    tracemalloc counts allocations from every thread in the process, so
+    memory is only traced when the worker serves one request at a time
+    (see worker_concurrency); otherwise only timings are captured.
+    """
+    enabled = True
+
+    def __init__(self, folder: str, trigger: str, path: str, max_captures: int = DEFAULT_MAX_CAPTURES,
+                 concurrency: Optional[Dict] = None):
+        self.id = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.root = folder
+        self.folder = os.path.join(folder, self.id)
+        self.max_captures = max_captures
+        self.trigger = trigger
+        self.path = path
+        self.concurrency = concurrency or {}
+        self.stages: List[Dict] = []
+        self.input_file: Optional[str] = None
+        self.profiler = cProfile.Profile()
+        self._started = time.perf_counter()
+        self.trace_memory = not (self.concurrency.get('multithread') or self.concurrency.get('green_threads'))
+        self._owns_tracemalloc = self.trace_memory and not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Profile the enclosed block as one named stage"""
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        self.profiler.enable()
+        try:
+            yield
+        finally:
+            self.profiler.disable()
+            stage = {'name': name, 'seconds': round(time.perf_counter() - start, 6),
+                     'allocated_bytes': None, 'peak_bytes': None}
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                stage['allocated_bytes'] = current - start_memory
+                stage['peak_bytes'] = peak - start_memory
+            self.stages.append(stage)
+
+    def quarantine(self, file_path: str, filename: str):
+        """Keep a copy of the input file next to the profile"""
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            shutil.copy2(file_path, os.path.join(self.folder, f"input_{filename}"))
+            self.input_file = f"input_{filename}"
+        except OSError as e:
+            logger.error(f"Error quarantining {filename} for profile {self.id}: {str(e)}")
+
+    def finish(self):
+        """Write the artifacts and release the capture slot"""
+        try:
+            snapshot = tracemalloc.take_snapshot() if self.trace_memory else None
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+            os.makedirs(self.folder, exist_ok=True)
+
+            self.profiler.dump_stats(os.path.join(self.folder, 'profile.pstats'))
+            summary = io.StringIO()
+            pstats.Stats(self.profiler, stream=summary).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+            with open(os.path.join(self.folder, 'profile.txt'), 'w', encoding='utf-8') as f:
+                f.write(summary.getvalue())
+
+            if snapshot is not None:
+                with open(os.path.join(self.folder, 'allocations.txt'), 'w', encoding='utf-8') as f:
+                    for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+                        f.write(f"{stat}\n")
+
+            meta = {
+                'id': self.id,
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'trigger': self.trigger,
+                'path': self.path,
+                'total_seconds': round(time.perf_counter() - self._started, 6),
+                'worker': self.concurrency,
+                'memory_traced': self.trace_memory,
+                'stages': self.stages,
+                'input_file': self.input_file,
+                'artifacts': sorted(os.listdir(self.folder)) + ['meta.json'],
+            }
+            with open(os.path.join(self.folder, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving request profile {self.id}: {str(e)}")
+        finally:
+            prune_profiles(self.root, self.max_captures)
+            _capture_lock.release()
+
+
+def worker_concurrency(environ) -> Dict:
+    """Describe how the serving worker runs requests, from the WSGI environ
+
+    ``multithread`` is set by threaded workers (gunicorn gthread, the Flask
+    dev server); ``green_threads`` names gevent or eventlet when either has
+    patched threading.
+    """
+    green_threads = None
+    gevent_monkey = sys.modules.get('gevent.monkey')
+    if gevent_monkey is not None and gevent_monkey.is_module_patched('threading'):
+        green_threads = 'gevent'
+    eventlet_patcher = sys.modules.get('eventlet.patcher')
+    if eventlet_patcher is not None and eventlet_patcher.is_monkey_patched('thread'):
+        green_threads = 'eventlet'
+    return {
+        'server': environ.get('SERVER_SOFTWARE', ''),
+        'multithread': bool(environ.get('wsgi.multithread')),
+        'green_threads': green_threads,
+        'active_threads': threading.active_count(),
+    }
+
+
+def has_admin_token(app, request) -> bool:
+    """True when the request carries the configured PROFILE_TOKEN"""
+    token = app.config.get('PROFILE_TOKEN')
+    supplied = request.headers.get(TOKEN_HEADER) or request.args.get(TOKEN_PARAM)
+    if not (token and supplied):
+        return False
+    # compare_digest only accepts ASCII str, so compare bytes
+    return hmac.compare_digest(token.encode('utf-8'), supplied.encode('utf-8', 'surrogateescape'))
+
+
+def start_request_profile(app, request):
+    """Return a RequestProfile if this request should be profiled, else a NullProfile
+
+    A request is profiled when it carries the admin token, or when sampling
+    (PROFILE_SAMPLE_RATE = N) picks it as the Nth request.
+    """
+    sample_rate = app.config.get('PROFILE_SAMPLE_RATE', 0)
+    if has_admin_token(app, request):
+        trigger = 'admin'
+    elif sample_rate and next(_request_counter) % sample_rate == 0:
+        trigger = 'sample'
+    else:
+        return NullProfile()
+
+    if not _capture_lock.acquire(blocking=False):
+        logger.warning("Profile capture already running, skipping this request")
+        return NullProfile()
+    try:
+        return RequestProfile(app.config['PROFILE_FOLDER'], trigger, request.path,
+                              app.config.get('PROFILE_MAX_CAPTURES', DEFAULT_MAX_CAPTURES),
+                              worker_concurrency(request.environ))
+    except Exception as e:
+        _capture_lock.release()
+        logger.error(f"Error starting request profile: {str(e)}")
+        return NullProfile()
+
+
+def prune_profiles(folder: str, keep: int):
+    """Delete all but the newest ``keep`` captures in ``folder``"""
+    try:
+        # Capture ids start with a UTC timestamp, so they sort oldest first
+        profile_ids = sorted(entry.name for entry in os.scandir(folder) if entry.is_dir())
+    except OSError:
+        return
+    for profile_id in profile_ids[:max(0, len(profile_ids) - keep)]:
+        shutil.rmtree(os.path.join(folder, profile_id), ignore_errors=True)
+
+
+def list_profiles(folder: str) -> List[Dict]:
+    """Return the metadata of captured profiles, newest first"""
+    if not os.path.isdir(folder):
+        return []
+    profiles = []
+    for profile_id in os.listdir(folder):
+        meta_path = os.path.join(folder, profile_id, 'meta.json')
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                profiles.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return sorted(profiles, key=lambda meta: meta['id'], reverse=True)
@@ -0,0 +1,217 @@
+import json
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Dict, List
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; JSON serialization always works
+    msgpack = None
+
+
+@dataclass(slots=True)
+class Experience:
+    position: str = ''
+    company: str = ''
+    duration: str = ''
+    description: str = ''
+
+    def to_row(self) -> tuple:
+        return (self.position, self.company, self.duration, self.description)
+
+    @classmethod
+    def from_row(cls, row) -> 'Experience':
+        return cls(*row)
+
+
+@dataclass(slots=True)
+class Education:
+    degree: str = ''
+    institution: str = ''
+    year: str = ''
+
+    def to_row(self) -> tuple:
+        return (self.degree, self.institution, self.year)
+
+    @classmethod
+    def from_row(cls, row) -> 'Education':
+        return cls(*row)
+
+
+@dataclass(slots=True)
+class Project:
+    title: str = ''
+    description: str = ''
+    technologies: List[str] = field(default_factory=list)
+    url: str = ''
+
+    def to_row(self) -> tuple:
+        return (self.title, self.description, self.technologies, self.url)
+
+    @classmethod
+    def from_row(cls, row) -> 'Project':
+        title, description, technologies, url = row
+        return cls(title, description, list(technologies), url)
+
+
+@dataclass(slots=True)
+class Certification:
+    name: str = ''
+    issuer: str = ''
+    year: str = ''
+
+    def to_row(self) -> tuple:
+        return (self.name, self.issuer, self.year)
+
+    @classmethod
+    def from_row(cls, row) -> 'Certification':
+        return cls(*row)
+
+
+@dataclass(slots=True)
+class Language:
+    name: str = ''
+    proficiency: str = ''
+
+    def to_row(self) -> tuple:
+        return (self.name, self.proficiency)
+
+    @classmethod
+    def from_row(cls, row) -> 'Language':
+        return cls(*row)
+
+
+# Nested list fields of Resume and the entry type stored in each
+_ENTRY_TYPES = {
+    'experience': Experience,
+    'projects': Project,
+    'education': Education,
+    'certifications': Certification,
+    'languages': Language,
+}
+
+
+@dataclass(slots=True)
+class Resume:
+    name: str = ''
+    email: str = ''
+    phone: str = ''
+    location: str = ''
+    linkedin: str = ''
+    github: str = ''
+    portfolio_url: str = ''
+    summary: str = ''
+    skills: List[str] = field(default_factory=list)
+    experience: List[Experience] = field(default_factory=list)
+    projects: List[Project] = field(default_factory=list)
+    education: List[Education] = field(default_factory=list)
+    certifications: List[Certification] = field(default_factory=list)
+    achievements: List[str] = field(default_factory=list)
+    languages: List[Language] = field(default_factory=list)
+    interests: List[str] = field(default_factory=list)
+    raw_text: str = ''
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare field values, so a LazyResume equals a Resume holding the same data
+        if not isinstance(other, Resume):
+            return NotImplemented
+        return self.to_row() == other.to_row()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access kept for callers written against the old parse result"""
+        return getattr(self, key, default)
+
+    def template_context(self, **extra) -> Dict[str, Any]:
+        """Return the keyword arguments for portfolio_template.html
+
+        Values are references to this resume's fields, nothing is copied.
+        """
+        context = {name: getattr(self, name) for name in _CONTEXT_FIELDS}
+        context.update(extra)
+        return context
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain dicts and lists (the legacy parse result layout)"""
+        data = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if f.name in _ENTRY_TYPES:
+                value = [{e.name: getattr(entry, e.name) for e in fields(entry)} for entry in value]
+            elif isinstance(value, list):
+                value = list(value)
+            data[f.name] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Resume':
+        """Build a Resume from a legacy parse result dict, ignoring unknown keys"""
+        kwargs = {}
+        for f in fields(cls):
+            if f.name not in data or data[f.name] is None:
+                continue
+            value = data[f.name]
+            entry_type = _ENTRY_TYPES.get(f.name)
+            if entry_type is not None:
+                value = [_entry_from_dict(entry_type, entry) for entry in value
+                         if isinstance(entry, (dict, entry_type))]
+            elif isinstance(value, list):
+                value = list(value)
+            kwargs[f.name] = value
+        return cls(**kwargs)
+
+    def to_row(self) -> tuple:
+        """Positional representation used for the compact binary format"""
+        row = []
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if f.name in _ENTRY_TYPES:
+                value = [entry.to_row() for entry in value]
+            row.append(value)
+        return tuple(row)
+
+    @classmethod
+    def from_row(cls, row) -> 'Resume':
+        values = []
+        for f, value in zip(fields(cls), row):
+            entry_type = _ENTRY_TYPES.get(f.name)
+            if entry_type is not None:
+                value = [entry_type.from_row(entry) for entry in value]
+            elif isinstance(value, (list, tuple)):
+                value = list(value)
+            values.append(value)
+        return cls(*values)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(',', ':'), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, payload: str) -> 'Resume':
+        return cls.from_dict(json.loads(payload))
+
+    def to_msgpack(self) -> bytes:
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+        return msgpack.packb(self.to_row(), use_bin_type=True)
+
+    @classmethod
+    def from_msgpack(cls, payload: bytes) -> 'Resume':
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+        return cls.from_row(msgpack.unpackb(payload, raw=False))
+
+
+def field_default(name: str) -> Any:
+    """Return a fresh default value for a Resume field"""
+    f = Resume.__dataclass_fields__[name]
+    return f.default_factory() if f.default_factory is not MISSING else f.default
+
+
+_CONTEXT_FIELDS = tuple(f.name for f in fields(Resume) if f.name != 'raw_text')
+
+
+def _entry_from_dict(entry_type, entry: Any) -> Any:
+    if isinstance(entry, entry_type):
+        return entry
+    kwargs = {f.name: entry[f.name] for f in fields(entry_type) if entry.get(f.name) is not None}
+    if 'technologies' in kwargs:
+        kwargs['technologies'] = list(kwargs['technologies'])
+    return entry_type(**kwargs)
@@ -0,0 +1,329 @@
+import atexit
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Iterable, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # no flock (Windows): the request limit is per process only
+    fcntl = None
+
+# Image filters whose raw stream bytes are already a file Tesseract can read
+_PASSTHROUGH_FILTERS = ('/DCTDecode', '/JPXDecode')
+
+
+# How deep to follow Form XObjects nested inside each other when looking for fonts
+_MAX_FORM_DEPTH = 8
+
+
+def _has_fonts(resources, depth: int = 0) -> bool:
+    """True if a resource dictionary, or any Form XObject it uses, has fonts"""
+    fonts = resources.get('/Font')
+    if fonts is not None and len(fonts.get_object()) > 0:
+        return True
+    xobjects = resources.get('/XObject')
+    if xobjects is None or depth >= _MAX_FORM_DEPTH:
+        return False
+    xobjects = xobjects.get_object()
+    for name in xobjects:
+        xobject = xobjects[name].get_object()
+        form_resources = xobject.get('/Resources') if xobject.get('/Subtype') == '/Form' else None
+        if form_resources is not None and _has_fonts(form_resources.get_object(), depth + 1):
+            return True
+    return False
+
+
+def page_is_image_only(page) -> bool:
+    """Cheaply tell whether a PDF page is a scan: images but no fonts
+
+    Only resource dictionaries are inspected (the page's and those of any
+    Form XObjects it draws); no content stream or image data is decoded.
+    """
+    resources = page.get('/Resources')
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if _has_fonts(resources):
+        return False
+    xobjects = resources.get('/XObject')
+    if xobjects is None:
+        return False
+    xobjects = xobjects.get_object()
+    return any(xobjects[name].get_object().get('/Subtype') == '/Image' for name in xobjects)
+
+
+def page_images(page) -> List[bytes]:
+    """Return the encoded images of a page in a format Tesseract accepts
+
+    JPEG and JPEG 2000 streams are passed through untouched. Other encodings
+    go through PyPDF2's image extraction, which needs pillow.
+    """
+    xobjects = page['/Resources'].get_object()['/XObject'].get_object()
+    images = [xobjects[name].get_object() for name in xobjects]
+    images = [image for image in images if image.get('/Subtype') == '/Image']
+    if all(image.get('/Filter') in _PASSTHROUGH_FILTERS for image in images):
+        return [image.get_data() for image in images]
+    return [image.data for image in page.images]
+
+
+def _run_tesseract(image: bytes, command: str, language: str, timeout: float) -> str:
+    """OCR one image with the Tesseract CLI (runs inside the OCR pool)"""
+    result = subprocess.run(
+        [command, 'stdin', 'stdout', '-l', language],
+        input=image, capture_output=True, timeout=timeout, check=True
+    )
+    return result.stdout.decode('utf-8', errors='replace')
+
+
+class RequestSlots:
+    """Server-wide limit on the number of requests running OCR at once
+
+    Each slot is a lock file taken with a non-blocking flock, so the limit
+    is shared by every worker process using the same folder, and a slot is
+    freed by the kernel if its worker dies.
+    """
+
+    def __init__(self, folder: str, count: int):
+        self.folder = folder
+        self.count = count
+        self._local = threading.BoundedSemaphore(count) if fcntl is None else None
+        os.makedirs(folder, exist_ok=True)
+
+    @contextmanager
+    def acquire(self):
+        """Yield True while holding a slot, or False at once if all are taken"""
+        if fcntl is None:
+            acquired = self._local.acquire(blocking=False)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    self._local.release()
+            return
+
+        for slot in range(self.count):
+            handle = open(os.path.join(self.folder, f"ocr_slot_{slot}.lock"), 'a')
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                handle.close()
+                continue
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+                handle.close()
+            return
+        yield False
+
+
+class OcrEngine:
+    """Tesseract OCR in a dedicated, size-limited process pool
+
+    The pool is separate from whatever serves requests, and admission is
+    capped at ``max_pending`` images: when the pool is saturated new pages
+    are skipped instead of queued, so slow scans cannot pile up behind the
+    workers handling ordinary text PDFs. On top of that, at most
+    ``max_requests`` requests across the whole server run OCR at once
+    (see RequestSlots); further scans skip OCR instead of waiting, so keep
+    it below the number of server workers. Each call to ocr_pages has one
+    overall deadline (``request_timeout``), which must stay below the server
+    worker timeout so a scan can never get its request worker killed.
+    Results are cached on disk, keyed by the page image, the Tesseract
+    command and the language, and the oldest entries are pruned once the
+    cache holds more than ``cache_max_entries`` results.
+    """
+
+    def __init__(self, max_workers: int = 2, page_timeout: float = 15.0, request_timeout: float = 20.0,
+                 max_pending: Optional[int] = None, max_requests: int = 1, cache_dir: Optional[str] = 'ocr_cache',
+                 cache_max_entries: int = 1000, command: str = 'tesseract', language: str = 'eng'):
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self.page_timeout = min(page_timeout, request_timeout)
+        self.request_timeout = request_timeout
+        self.max_pending = max_pending if max_pending is not None else max_workers * 4
+        self.cache_dir = cache_dir
+        self.cache_max_entries = cache_max_entries
+        self.command = command
+        self.language = language
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.request_slots = RequestSlots(cache_dir or os.path.join(tempfile.gettempdir(), 'portfolio_ocr'),
+                                          max_requests)
+
+    @property
+    def available(self) -> bool:
+        return shutil.which(self.command) is not None
+
+    def ocr_pages(self, pages: Iterable) -> List[str]:
+        """OCR image-only PDF pages, returning one text per page ('' on failure)"""
+        deadline = time.monotonic() + self.request_timeout
+        pages = list(pages)
+        if not self.available:
+            self.logger.warning(f"OCR skipped: '{self.command}' not found")
+            return ['' for _ in pages]
+
+        texts = [[] for _ in pages]
+        uncached = []
+        for index, page in enumerate(pages):
+            try:
+                images = page_images(page)
+            except Exception as e:
+                self.logger.warning(f"Could not extract images from page {index + 1}: {str(e)}")
+                continue
+            for image in images:
+                digest = self._cache_key(image)
+                cached = self._cache_get(digest)
+                if cached is not None:
+                    texts[index].append(cached)
+                else:
+                    uncached.append((index, digest, image))
+
+        if uncached:
+            with self.request_slots.acquire() as acquired:
+                if acquired:
+                    self._ocr_images(uncached, texts, deadline)
+                else:
+                    self.logger.warning(f"OCR busy on other requests, skipping {len(uncached)} page image(s)")
+
+        return ['\n'.join(parts) for parts in texts]
+
+    def _ocr_images(self, images: List[tuple], texts: List[List[str]], deadline: float):
+        """Run (page index, cache key, image) jobs in the pool, appending results to ``texts``"""
+        pending = []
+        for index, digest, image in images:
+            if not self._slots.acquire(blocking=False):
+                self.logger.warning(f"OCR pool saturated, skipping page {index + 1}")
+                continue
+            pool = self._get_pool()
+            try:
+                future = pool.submit(_run_tesseract, image, self.command, self.language, self.page_timeout)
+            except BrokenProcessPool:
+                self._slots.release()
+                self._discard_pool(pool)
+                self.logger.warning(f"OCR pool broken, skipping page {index + 1}")
+                continue
+            future.add_done_callback(lambda _: self._slots.release())
+            pending.append((index, digest, pool, future))
+
+        for index, digest, pool, future in pending:
+            try:
+                text = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                future.cancel()
+                self.logger.warning(f"OCR deadline reached, giving up on page {index + 1}")
+                continue
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+                self.logger.warning(f"OCR worker died on page {index + 1}")
+                continue
+            except Exception as e:
+                self.logger.warning(f"OCR failed on page {index + 1}: {str(e)}")
+                continue
+            self._cache_put(digest, text)
+            texts[index].append(text)
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """Drop a broken pool so the next job starts a fresh one"""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    def _cache_key(self, image: bytes) -> str:
+        digest = hashlib.sha256(f"{self.command}\0{self.language}\0".encode('utf-8'))
+        digest.update(image)
+        return digest.hexdigest()
+
+    def _cache_get(self, digest: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(os.path.join(self.cache_dir, f"{digest}.txt"), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _cache_put(self, digest: str, text: str):
+        if not self.cache_dir:
+            return
+        path = os.path.join(self.cache_dir, f"{digest}.txt")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache OCR result: {str(e)}")
+            return
+        self._cache_prune()
+
+    def _cache_prune(self):
+        """Delete the oldest cached results beyond cache_max_entries"""
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith('.txt')]
+        except OSError:
+            return
+        if len(entries) <= self.cache_max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.cache_max_entries]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+_engine = None
+_engine_pid = None
+_engine_lock = threading.Lock()
+
+
+def get_ocr_engine() -> OcrEngine:
+    """Return this process's OCR engine, configured from OCR_* environment variables"""
+    global _engine, _engine_pid
+    with _engine_lock:
+        # A forked server worker must not reuse its parent's pool
+        if _engine is None or _engine_pid != os.getpid():
+            _engine = OcrEngine(
+                max_workers=int(os.environ.get('OCR_MAX_WORKERS', 2)),
+                page_timeout=float(os.environ.get('OCR_PAGE_TIMEOUT', 15)),
+                request_timeout=float(os.environ.get('OCR_REQUEST_TIMEOUT', 20)),
+                max_pending=int(os.environ['OCR_MAX_PENDING']) if 'OCR_MAX_PENDING' in os.environ else None,
+                max_requests=int(os.environ.get('OCR_MAX_REQUESTS', 1)),
+                cache_dir=os.environ.get('OCR_CACHE_DIR', 'ocr_cache'),
+                cache_max_entries=int(os.environ.get('OCR_CACHE_MAX_ENTRIES', 1000)),
+                command=os.environ.get('TESSERACT_CMD', 'tesseract'),
+                language=os.environ.get('OCR_LANG', 'eng'),
+            )
+            _engine_pid = os.getpid()
+            workers = os.environ.get('WEB_CONCURRENCY')
+            if workers and _engine.request_slots.count >= int(workers):
+                _engine.logger.warning("OCR_MAX_REQUESTS should be below WEB_CONCURRENCY, "
+                                       "or scanned uploads can occupy every worker")
+            atexit.register(_engine.shutdown)
+        return _engine
@@ -1,16 +1,32 @@
 import os
 import re
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 import PyPDF2
 from docx import Document
 
+from resume_ocr import OcrEngine, get_ocr_engine, page_is_image_only
+from resume_models import Certification, Education, Experience, Language, Project, Resume, field_default
+
+# Fields the contact-only callers need (Portfolio row, /api/contact)
+CONTACT_FIELDS = ('name', 'email', 'phone', 'location', 'linkedin', 'github', 'portfolio_url')
+
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, ocr: Optional[OcrEngine] = None):
         self.logger = logging.getLogger(__name__)
+        self.ocr = ocr
         
-    def parse_resume(self, file_path: str) -> Optional[Dict]:
-        """Parse resume and extract relevant information"""
+    def parse_resume(self, file_path: str, fields: Optional[Iterable[str]] = None) -> Optional[Resume]:
+        """Parse resume and extract relevant information
+
+        Pass ``fields`` to restrict extraction to a subset, e.g.
+        ``parse_resume(path, fields=CONTACT_FIELDS)``.
+        """
+        if fields is not None:
+            fields = frozenset(fields)
+            unknown = fields - EXTRACTORS.keys()
+            if unknown:
+                raise ValueError(f"Unknown resume fields: {', '.join(sorted(unknown))}")
         try:
             # Extract text based on file extension
             if file_path.lower().endswith('.pdf'):
@@ -21,12 +37,12 @@ class ResumeParser:
                 self.logger.error(f"Unsupported file format: {file_path}")
                 return None
             
-            if not text:
+            if not text.strip():
                 self.logger.error("No text extracted from file")
                 return None
             
             # Parse extracted text
-            parsed_data = self._parse_text(text)
+            parsed_data = self._parse_text(text, fields)
             return parsed_data
             
         except Exception as e:
@@ -34,13 +50,33 @@ class ResumeParser:
             return None
     
     def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text from PDF file"""
+        """Extract text from PDF file, falling back to OCR for scanned pages"""
         text = ""
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                page_texts = []
+                scanned_pages = {}
+                for index, page in enumerate(pdf_reader.pages):
+                    if page_is_image_only(page):
+                        scanned_pages[index] = page
+                        page_texts.append("")
+                    else:
+                        page_texts.append(page.extract_text())
+
+                if scanned_pages:
+                    ocr = self.ocr if self.ocr is not None else get_ocr_engine()
+                    try:
+                        ocr_texts = ocr.ocr_pages(scanned_pages.values())
+                    except Exception as e:
+                        # Keep the text pages even if OCR fails outright
+                        self.logger.warning(f"OCR failed, skipping scanned pages: {str(e)}")
+                        ocr_texts = []
+                    for index, page_text in zip(scanned_pages, ocr_texts):
+                        page_texts[index] = page_text
+
+                for page_text in page_texts:
+                    text += page_text + "\n"
         except Exception as e:
             self.logger.error(f"Error extracting PDF text: {str(e)}")
         return text
@@ -56,29 +92,28 @@ class ResumeParser:
             self.logger.error(f"Error extracting DOCX text: {str(e)}")
         return text
     
-    def _parse_text(self, text: str) -> Dict:
-        """Parse extracted text and identify sections"""
-        parsed_data = {
-            'name': self._extract_name(text),
-            'email': self._extract_email(text),
-            'phone': self._extract_phone(text),
-            'location': self._extract_location(text),
-            'linkedin': self._extract_linkedin(text),
-            'github': self._extract_github(text),
-            'portfolio_url': self._extract_portfolio_url(text),
-            'summary': self._extract_summary(text),
-            'skills': self._extract_skills(text),
-            'experience': self._extract_experience(text),
-            'projects': self._extract_projects(text),
-            'education': self._extract_education(text),
-            'certifications': self._extract_certifications(text),
-            'achievements': self._extract_achievements(text),
-            'languages': self._extract_languages(text),
-            'interests': self._extract_interests(text),
-            'raw_text': text
-        }
-        
-        return parsed_data
+    def _parse_text(self, text: str, fields: Optional[Iterable[str]] = None) -> Resume:
+        """Parse extracted text and identify sections
+
+        Sections are extracted lazily on first access. When ``fields`` is
+        given, every other field keeps its empty default and its extractor
+        never runs.
+        """
+        return LazyResume(self, text, fields)
+    
+    def extract_field(self, field_name: str, text: str) -> Any:
+        """Run the registered extractor for one field
+
+        Method names are looked up on ``self`` so subclass overrides apply.
+        """
+        extractor = EXTRACTORS[field_name]
+        try:
+            if isinstance(extractor, str):
+                return getattr(self, extractor)(text)
+            return extractor(self, text)
+        except Exception as e:
+            self.logger.error(f"Error extracting {field_name}: {str(e)}")
+            return field_default(field_name)
     
     def _extract_name(self, text: str) -> str:
         """Extract name from resume text"""
@@ -149,7 +184,7 @@ class ResumeParser:
         
         return skills[:20]  # Limit to 20 skills
     
-    def _extract_experience(self, text: str) -> List[Dict]:
+    def _extract_experience(self, text: str) -> List[Experience]:
         """Extract work experience from resume text"""
         experience = []
         exp_keywords = ['experience', 'work history', 'employment', 'professional experience']
@@ -158,7 +193,7 @@ class ResumeParser:
         for i, line in enumerate(lines):
             if any(keyword in line.lower() for keyword in exp_keywords):
                 # Extract experience entries
-                current_job = {}
+                current_job = None
                 for j in range(i + 1, len(lines)):
                     exp_line = lines[j].strip()
                     if not exp_line:
@@ -168,24 +203,24 @@ class ResumeParser:
                         break
                     
                     # Simple job parsing
-                    if current_job and ('company' not in current_job or 'position' not in current_job):
+                    if current_job is not None and not (current_job.company and current_job.position):
                         if len(exp_line.split()) <= 6:  # Likely a job title or company
-                            if 'position' not in current_job:
-                                current_job['position'] = exp_line
-                            elif 'company' not in current_job:
-                                current_job['company'] = exp_line
+                            if not current_job.position:
+                                current_job.position = exp_line
+                            elif not current_job.company:
+                                current_job.company = exp_line
                     elif len(experience) < 5:  # Limit to 5 jobs
-                        if current_job:
+                        if current_job is not None:
                             experience.append(current_job)
-                        current_job = {'position': exp_line, 'description': ''}
+                        current_job = Experience(position=exp_line)
                 
-                if current_job:
+                if current_job is not None:
                     experience.append(current_job)
                 break
         
         return experience
     
-    def _extract_education(self, text: str) -> List[Dict]:
+    def _extract_education(self, text: str) -> List[Education]:
         """Extract education information from resume text"""
         education = []
         edu_keywords = ['education', 'academic', 'degree', 'university', 'college']
@@ -203,11 +238,7 @@ class ResumeParser:
                         break
                     
                     if len(edu_line.split()) > 2:  # Likely an education entry
-                        education.append({
-                            'degree': edu_line,
-                            'institution': '',
-                            'year': ''
-                        })
+                        education.append(Education(degree=edu_line))
                 break
         
         return education
@@ -269,7 +300,7 @@ class ResumeParser:
                 return domain
         return ""
     
-    def _extract_projects(self, text: str) -> List[Dict]:
+    def _extract_projects(self, text: str) -> List[Project]:
         """Extract projects from resume text"""
         projects = []
         project_keywords = ['projects', 'portfolio', 'personal projects', 'key projects']
@@ -288,12 +319,7 @@ class ResumeParser:
                     
                     # Look for project patterns
                     if len(project_line) > 10 and len(projects) < 6:
-                        project = {
-                            'title': project_line,
-                            'description': '',
-                            'technologies': [],
-                            'url': ''
-                        }
+                        project = Project(title=project_line)
                         
                         # Look for technologies in next few lines
                         for k in range(j + 1, min(j + 3, len(lines))):
@@ -301,17 +327,17 @@ class ResumeParser:
                                 next_line = lines[k].strip()
                                 if any(tech_word in next_line.lower() for tech_word in ['tech', 'built', 'using', 'language']):
                                     tech_list = re.split(r'[,•·\-]', next_line)
-                                    project['technologies'] = [t.strip() for t in tech_list if t.strip()][:5]
+                                    project.technologies = [t.strip() for t in tech_list if t.strip()][:5]
                                     break
                                 elif next_line and len(next_line) > 20:
-                                    project['description'] = next_line
+                                    project.description = next_line
                         
                         projects.append(project)
                 break
         
         return projects
     
-    def _extract_certifications(self, text: str) -> List[Dict]:
+    def _extract_certifications(self, text: str) -> List[Certification]:
         """Extract certifications from resume text"""
         certifications = []
         cert_keywords = ['certification', 'certificate', 'licensed', 'certified', 'credentials']
@@ -333,11 +359,7 @@ class ResumeParser:
                         year_match = re.search(r'(20\d{2})', cert_line)
                         year = year_match.group(1) if year_match else ''
                         
-                        certifications.append({
-                            'name': cert_line,
-                            'issuer': '',
-                            'year': year
-                        })
+                        certifications.append(Certification(name=cert_line, year=year))
                 break
         
         return certifications
@@ -365,7 +387,7 @@ class ResumeParser:
         
         return achievements
     
-    def _extract_languages(self, text: str) -> List[Dict]:
+    def _extract_languages(self, text: str) -> List[Language]:
         """Extract languages from resume text"""
         languages = []
         language_keywords = ['language', 'fluent', 'native', 'proficient']
@@ -392,10 +414,7 @@ class ResumeParser:
                             elif 'intermediate' in lang_line:
                                 proficiency = 'Intermediate'
                             
-                            languages.append({
-                                'name': lang.title(),
-                                'proficiency': proficiency
-                            })
+                            languages.append(Language(name=lang.title(), proficiency=proficiency))
                 break
         
         return languages
@@ -425,3 +444,61 @@ class ResumeParser:
                 break
         
         return interests
+
+
+class LazyResume(Resume):
+    """Resume whose fields are extracted on first access and memoized
+
+    Unset slots raise AttributeError, which routes the first read of each
+    field through ``__getattr__``; later reads hit the stored slot directly.
+    """
+    __slots__ = ('_parser', '_text', '_wanted')
+
+    def __init__(self, parser: ResumeParser, text: str, fields: Optional[Iterable[str]] = None):
+        self._parser = parser
+        self._text = text
+        self._wanted = None if fields is None else frozenset(fields)
+        self.raw_text = text
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in EXTRACTORS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        if self._wanted is None or name in self._wanted:
+            value = self._parser.extract_field(name, self._text)
+        else:
+            value = field_default(name)
+        setattr(self, name, value)
+        return value
+
+
+# Field name -> ResumeParser method name, or a callable extractor(parser, text).
+# Order matches the Resume fields.
+EXTRACTORS: Dict[str, Union[str, Callable[[ResumeParser, str], Any]]] = {
+    'name': '_extract_name',
+    'email': '_extract_email',
+    'phone': '_extract_phone',
+    'location': '_extract_location',
+    'linkedin': '_extract_linkedin',
+    'github': '_extract_github',
+    'portfolio_url': '_extract_portfolio_url',
+    'summary': '_extract_summary',
+    'skills': '_extract_skills',
+    'experience': '_extract_experience',
+    'projects': '_extract_projects',
+    'education': '_extract_education',
+    'certifications': '_extract_certifications',
+    'achievements': '_extract_achievements',
+    'languages': '_extract_languages',
+    'interests': '_extract_interests',
+}
+
+
+def register_extractor(field_name: str, extractor: Union[str, Callable[[ResumeParser, str], Any]]) -> None:
+    """Register (or replace) the extractor used for a Resume field
+
+    Pass a method name to have it resolved on each parser instance, or a
+    callable taking (parser, text).
+    """
+    if field_name == 'raw_text' or field_name not in Resume.__dataclass_fields__:
+        raise ValueError(f"Unknown resume field: {field_name}")
+    EXTRACTORS[field_name] = extractor
@@ -1,13 +1,15 @@
 import os
 import uuid
 import zipfile
-from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file
+from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file, send_from_directory, jsonify, abort
 from werkzeug.utils import secure_filename
 
 from extensions import db
 from models import Portfolio
-from resume_parser import ResumeParser
+from resume_parser import CONTACT_FIELDS, ResumeParser
 from portfolio_generator import PortfolioGenerator
+from portfolio_themes import DEFAULT_THEME, THEMES, get_renderer, theme_filename
+from request_profiling import NullProfile, has_admin_token, list_profiles, start_request_profile
 
 routes = Blueprint('routes', __name__)
 
@@ -16,6 +18,23 @@ ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def portfolio_theme_path(app, portfolio, theme):
+    """Return (theme, path) of a generated portfolio file
+
+    Portfolios generated before themes existed only have the default theme
+    file, so a missing theme falls back to it.
+    """
+    path = os.path.join(app.config['GENERATED_FOLDER'], theme_filename(portfolio.generated_filename, theme))
+    if theme != DEFAULT_THEME and not os.path.exists(path):
+        return portfolio_theme_path(app, portfolio, DEFAULT_THEME)
+    return theme, path
+
+def available_themes(app, portfolio):
+    """Return the themes a portfolio has been rendered with"""
+    return [theme for theme in THEMES.values()
+            if os.path.exists(os.path.join(app.config['GENERATED_FOLDER'],
+                                           theme_filename(portfolio.generated_filename, theme.name)))]
+
 @routes.route('/')
 def index():
     return render_template('index.html')
@@ -27,7 +46,9 @@ def upload_page():
 @routes.route('/upload', methods=['POST'])
 def upload_file():
     from flask import current_app as app  # ✅ Delayed import to avoid circular ref
+    profile = NullProfile()
     try:
+        profile = start_request_profile(app, request)
         if 'resume' not in request.files:
             flash('No file selected', 'error')
             return redirect(request.url)
@@ -42,33 +63,42 @@ def upload_file():
             unique_filename = f"{uuid.uuid4()}_{filename}"
             filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
             file.save(filepath)
+            profile.quarantine(filepath, filename)
 
-            parser = ResumeParser()
-            parsed_data = parser.parse_resume(filepath)
+            with profile.stage('parse'):
+                parser = ResumeParser()
+                parsed_data = parser.parse_resume(filepath)
+                if profile.enabled and parsed_data:
+                    # Sections are extracted lazily; force them so parsing is profiled here
+                    parsed_data.to_row()
 
             if not parsed_data:
                 flash('Could not extract information from the resume. Please check the file format.', 'error')
                 os.remove(filepath)
                 return redirect(url_for('upload_page'))
 
-            generator = PortfolioGenerator()
-            portfolio_data = generator.generate_portfolio(parsed_data)
+            with profile.stage('generate'):
+                generator = PortfolioGenerator()
+                portfolio_data = generator.generate_portfolio(parsed_data)
 
             portfolio = Portfolio(
                 original_filename=filename,
                 generated_filename=f"portfolio_{uuid.uuid4()}.html",
-                name=parsed_data.get('name', 'Unknown'),
-                email=parsed_data.get('email', ''),
-                phone=parsed_data.get('phone', '')
+                name=parsed_data.name or 'Unknown',
+                email=parsed_data.email,
+                phone=parsed_data.phone
             )
             db.session.add(portfolio)
             db.session.commit()
 
-            portfolio_html = render_template('portfolio_template.html', **portfolio_data)
-            portfolio_path = os.path.join(app.config['GENERATED_FOLDER'], portfolio.generated_filename)
-
-            with open(portfolio_path, 'w', encoding='utf-8') as f:
-                f.write(portfolio_html)
+            # Render every theme now so switching themes never re-parses the resume
+            with profile.stage('render'):
+                rendered = get_renderer(app).render(portfolio_data)
+            for theme, portfolio_html in rendered.items():
+                portfolio_path = os.path.join(app.config['GENERATED_FOLDER'],
+                                              theme_filename(portfolio.generated_filename, theme))
+                with open(portfolio_path, 'w', encoding='utf-8') as f:
+                    f.write(portfolio_html)
 
             os.remove(filepath)
 
@@ -81,12 +111,37 @@ def upload_file():
         app.logger.error(f"Error processing upload: {str(e)}")
         flash('An error occurred while processing your resume. Please try again.', 'error')
         return redirect(url_for('routes.upload_page'))
+    finally:
+        profile.finish()
+
+@routes.route('/api/contact', methods=['POST'])
+def extract_contact():
+    """Return only the contact fields of an uploaded resume as JSON"""
+    from flask import current_app as app
+    file = request.files.get('resume')
+    if not file or not file.filename or not allowed_file(file.filename):
+        return jsonify({'error': 'Please upload a PDF or DOCX resume.'}), 400
+
+    filename = secure_filename(file.filename)
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], f"{uuid.uuid4()}_{filename}")
+    file.save(filepath)
+    try:
+        parsed_data = ResumeParser().parse_resume(filepath, fields=CONTACT_FIELDS)
+    finally:
+        os.remove(filepath)
+
+    if not parsed_data:
+        return jsonify({'error': 'Could not extract information from the resume.'}), 422
+    return jsonify({field: getattr(parsed_data, field) for field in CONTACT_FIELDS})
 
 @routes.route('/preview/<int:portfolio_id>')
 def preview(portfolio_id):
     from flask import current_app as app
     portfolio = Portfolio.query.get_or_404(portfolio_id)
-    portfolio_path = os.path.join(app.config['GENERATED_FOLDER'], portfolio.generated_filename)
+    theme = request.args.get('theme', DEFAULT_THEME)
+    if theme not in THEMES:
+        abort(404)
+    theme, portfolio_path = portfolio_theme_path(app, portfolio, theme)
 
     if not os.path.exists(portfolio_path):
         flash('Portfolio file not found.', 'error')
@@ -95,31 +150,51 @@ def preview(portfolio_id):
     with open(portfolio_path, 'r', encoding='utf-8') as f:
         portfolio_content = f.read()
 
-    return render_template('preview.html', portfolio=portfolio, portfolio_content=portfolio_content)
+    return render_template('preview.html', portfolio=portfolio, portfolio_content=portfolio_content,
+                           themes=available_themes(app, portfolio), current_theme=theme)
 
 @routes.route('/download/<int:portfolio_id>')
 def download_portfolio(portfolio_id):
     from flask import current_app as app
     portfolio = Portfolio.query.get_or_404(portfolio_id)
-    portfolio_path = os.path.join(app.config['GENERATED_FOLDER'], portfolio.generated_filename)
+    theme = request.args.get('theme', DEFAULT_THEME)
+    if theme not in THEMES:
+        abort(404)
+    theme, portfolio_path = portfolio_theme_path(app, portfolio, theme)
 
     if not os.path.exists(portfolio_path):
         flash('Portfolio file not found.', 'error')
         return redirect(url_for('routes.index'))
 
-    zip_filename = f"portfolio_{portfolio.name}_{portfolio.id}.zip"
+    suffix = '' if theme == DEFAULT_THEME else f"_{theme}"
+    zip_filename = f"portfolio_{portfolio.name}_{portfolio.id}{suffix}.zip"
     zip_path = os.path.join(app.config['GENERATED_FOLDER'], zip_filename)
 
     with zipfile.ZipFile(zip_path, 'w') as zipf:
         zipf.write(portfolio_path, 'index.html')
-        zipf.writestr('styles.css', CSS_CONTENT)
+        zipf.writestr('styles.css', str(get_renderer(app).css(theme)))
 
     return send_file(zip_path, as_attachment=True, download_name=zip_filename)
 
+@routes.route('/admin/profiles')
+def admin_profiles():
+    """List captured request profiles (admin token required)"""
+    from flask import current_app as app
+    if not has_admin_token(app, request):
+        abort(404)
+    return jsonify(list_profiles(app.config['PROFILE_FOLDER']))
+
+@routes.route('/admin/profiles/<profile_id>/<artifact>')
+def admin_profile_artifact(profile_id, artifact):
+    """Download one artifact (pstats, allocations, input copy) of a profile"""
+    from flask import current_app as app
+    if not has_admin_token(app, request):
+        abort(404)
+    profile_folder = os.path.abspath(app.config['PROFILE_FOLDER'])
+    return send_from_directory(os.path.join(profile_folder, secure_filename(profile_id)), artifact,
+                               as_attachment=True)
+
 @routes.app_errorhandler(413)
 def too_large(e):
     flash('File is too large. Maximum size is 16MB.', 'error')
     return redirect(url_for('routes.upload_page'))
-
-# Move this to a constants file if large
-CSS_CONTENT = """<your full CSS string here>"""